@@ -1,307 +1,739 @@
 import asyncio
+import contextlib
 import csv
+import json
+import logging
 import os
-from playwright.async_api import async_playwright
+import queue
+import random
+from urllib.parse import parse_qs, quote_plus, urlsplit
+import aiohttp
+from aiolimiter import AsyncLimiter
+from aiomultiprocess import Pool
+from selectolax.lexbor import LexborHTMLParser
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.util import Finalize
 
 INPUT_CSV_FILE = "speakers-2.csv"  # Input file with speakers
 OUTPUT_CSV_FILE = "duckduckgo_linkedin_profiles.csv"  # Output file to save profile links
+LOG_LEVEL = logging.INFO  # Set to logging.DEBUG for per-strategy details
+DEBUG = False  # Save the last results page as debug_<name>.html when no profile is found
+QUERY_CACHE_FILE = "ddg_query_cache.json"  # Resolved queries kept between runs; set to None to disable
+DDG_HTML_URL = "https://html.duckduckgo.com/html/"  # No-JS results endpoint, no browser needed
+WORKER_PROCESSES = os.cpu_count() or 1  # Processes running HTTP searches and result parsing
+CHILD_CONCURRENCY = 16  # Speakers each worker process searches at the same time
+MAX_CONCURRENT_SPEAKERS = WORKER_PROCESSES * CHILD_CONCURRENCY  # Enough in flight to fill every worker slot
+DDG_REQUESTS_PER_SECOND = 8  # Overall request budget against DuckDuckGo, bursts allowed up to this
+THROTTLE_STATUSES = {202, 429}  # DuckDuckGo's "slow down" answers, retried with backoff
+CSV_FLUSH_EVERY = 50  # Rows buffered before the output file is flushed
+OUTPUT_FIELDNAMES = ["query_name", "query_title", "query_company", "profile_link", "confidence_score"]
+BROWSER_POOL_SIZE = 8  # Browser pages for fallback searches
+CONTEXT_ROTATE_EVERY = 50  # Browser searches before cookies, user agent and pages are all rotated
+BROWSER_PROFILE_DIR = "./.pw-profile"  # Persistent browser profile: cookies and site storage survive between runs
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36"
+# Chromium flags for the fallback browser: hide automation and switch off GPU, background work and extras we never use
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-background-networking',
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--disable-translate',
+    '--mute-audio',
+    '--disable-sync'
+]
+# The browser picks one of these at launch and on every rotation so the fingerprint DuckDuckGo sees keeps changing
+USER_AGENTS = (
+    USER_AGENT,
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:99.0) Gecko/20100101 Firefox/99.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.4 Safari/605.1.15",
+)
 
-async def add_delay(seconds=2):
-    """Adds a small delay to avoid detection."""
-    await asyncio.sleep(seconds)
+# Patterns compiled once; result pages are matched as raw bytes so nothing is decoded just to search it
+_CLEAN_RE = re.compile(r'(https?://[^/]+/in/[^/?#]+)', re.ASCII)
+_LI_RE = re.compile(rb'https?://(?:\w+\.)?linkedin\.com/in/[^\s"\'<>&]+', re.ASCII)
+_DDG_REDIRECT_RE = re.compile(rb'href="([^"]*uddg=[^"]*)"', re.ASCII)
+# Byte substrings every LinkedIn profile link contains, plain or percent-encoded inside a redirect
+_LI_MARKERS = (b'linkedin.com/in/', b'linkedin.com%2Fin%2F', b'linkedin.com%2fin%2f')
+_SAFE_NAME_RE = re.compile(r'[^\w\s-]')
+_TRACKER_RE = re.compile(r'google-analytics|googletagmanager|doubleclick|scorecardresearch|improving\.duckduckgo\.com')
 
+# Resource types the scraper never reads; only link hrefs matter
+BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+
+log = logging.getLogger("ddg")
+
+# Search strategies as (description, confidence, query builder), highest confidence first.
+# A builder returns a falsy value when the speaker lacks the fields it needs.
+_LI_SITE = "site:linkedin.com/in"
+_STRATEGIES = (
+    ("Name + Title + Company", 4, lambda n, t, c: t and c and f'{_LI_SITE} "{n}" "{t}" "{c}"'),
+    ("Name + Company", 3, lambda n, t, c: c and f'{_LI_SITE} "{n}" "{c}"'),
+    ("Name + Title", 2, lambda n, t, c: t and f'{_LI_SITE} "{n}" "{t}"'),
+    ("Name only", 1, lambda n, t, c: f'{_LI_SITE} "{n}"'),
+)
+
+# Query string -> profile found for it (None when DuckDuckGo had no LinkedIn result)
+_QUERY_CACHE = {}
+
+# Query string -> task currently looking it up, so concurrent duplicates share one request
+_IN_FLIGHT = {}
+
+# Browser searches since the last context rotation. While a rotation runs, "held" collects
+# every pooled page (instead of the pool) and "all_held" fires once it has them all.
+_BROWSER_STATE = {"searches": 0, "held": None, "all_held": None}
+
+# HTTP session, limiter and event loop of a pool worker process, created lazily inside its event loop
+_WORKER_STATE = {}
+
+class BrowserFallbackNeeded(Exception):
+    """
+    A query needs the browser, which only the main process runs.
+    Carries the failing query and the queries the worker resolved before it.
+    """
+    def __init__(self, query):
+        super().__init__(query)
+        self.query = query
+        self.resolved = {}
+
+def setup_logging(level=LOG_LEVEL):
+    """
+    Sends log records through a queue to a listener thread that owns the stderr handler,
+    so workers never block on the stream. Returns the started listener; stop it on exit.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    
+    listener = QueueListener(log_queue, handler)
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(level)
+    log.propagate = False
+    listener.start()
+    return listener
+
+def write_debug_html(safe_name, html):
+    """Writes a results page to debug_<safe_name>.html. Runs on the I/O thread pool."""
+    try:
+        with open(f"debug_{safe_name}.html", "wb") as f:
+            f.write(html)
+        log.debug("💾 Saved debug HTML to debug_%s.html", safe_name)
+    except Exception as e:
+        log.warning("Could not save debug HTML: %s", e)
+
+def load_query_cache(path):
+    """Loads queries resolved by previous runs into the in-memory cache."""
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            _QUERY_CACHE.update(json.load(f))
+        log.info("📦 Loaded %d cached queries from %s", len(_QUERY_CACHE), path)
+    except (OSError, ValueError) as e:
+        log.warning("⚠️ Could not load query cache: %s", e)
+
+def save_query_cache(path):
+    """Persists the in-memory query cache so re-runs skip already resolved queries."""
+    if not path:
+        return
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_QUERY_CACHE, f)
+    except OSError as e:
+        log.warning("⚠️ Could not save query cache: %s", e)
+
+@lru_cache(maxsize=4096)
 def clean_linkedin_url(url):
-    """Clean LinkedIn URL to get the standard format."""
+    """Clean LinkedIn URL to get the standard format. Pure, so results are memoized."""
     # Extract the main profile part using regex
-    match = re.search(r'(https?://[^/]+/in/[^/?#]+)', url)
+    match = _CLEAN_RE.search(url)
     if match:
         return match.group(1)
     return url
 
-async def extract_linkedin_from_page(page):
-    """Extract LinkedIn profile URL from the current page using multiple strategies."""
-    linkedin_profile = None
+def has_linkedin_link(html):
+    """Cheap substring prefilter so pages without any LinkedIn link skip parsing and regexes."""
+    return any(marker in html for marker in _LI_MARKERS)
+
+def extract_linkedin_from_page(html):
+    """Extract LinkedIn profile URL from a rendered DuckDuckGo page's HTML (bytes)."""
+    if not has_linkedin_link(html):
+        return None
     
-    # Strategy 1: Try to get links directly using JavaScript evaluation
+    # Parse the page in C instead of querying the DOM through the browser driver
     try:
-        links = await page.evaluate("""
-            () => {
-                // Try multiple selector patterns
-                const selectors = [
-                    'article a[href*="linkedin.com/in/"]',
-                    '.result a[href*="linkedin.com/in/"]',
-                    'a[href*="linkedin.com/in/"]'
-                ];
-                
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    if (elements.length > 0) {
-                        return Array.from(elements).map(a => a.href);
-                    }
-                }
-                return [];
-            }
-        """)
-        if links and len(links) > 0:
-            linkedin_profile = links[0]  # Only take the first link
-            print(f"🎯 Found profile using JavaScript evaluation: {linkedin_profile}")
+        node = LexborHTMLParser(html).css_first('a[href*="linkedin.com/in/"]')
+        if node is not None and node.attributes.get("href"):
+            linkedin_profile = node.attributes["href"]
+            log.debug("🎯 Found profile in result link: %s", linkedin_profile)
             return clean_linkedin_url(linkedin_profile)
     except Exception as e:
-        print(f"JavaScript evaluation failed: {e}")
+        log.debug("HTML parsing failed: %s", e)
     
-    # Strategy 2: Try using a more comprehensive selector approach
-    try:
-        # Get all links on the page
-        all_links = await page.query_selector_all("a")
-        for link in all_links:
-            href = await link.get_attribute('href')
-            if href and 'linkedin.com/in/' in href:
-                linkedin_profile = href
-                print(f"🎯 Found profile using selector approach: {linkedin_profile}")
-                return clean_linkedin_url(linkedin_profile)
-    except Exception as e:
-        print(f"Selector approach failed: {e}")
+    # Extract from the raw HTML as a last resort
+    matches = _LI_RE.findall(html)
+    if matches:
+        linkedin_profile = matches[0].decode()  # Take only the first match
+        log.debug("🎯 Found profile using regex extraction: %s", linkedin_profile)
+        return clean_linkedin_url(linkedin_profile)
     
-    # Strategy 3: Extract from the HTML content as a last resort
-    try:
-        # Get all the HTML content
-        content = await page.content()
-        # Extract LinkedIn URLs using regex
-        matches = re.findall(r'https?://(?:www\.)?linkedin\.com/in/[^\s"\'<>]+', content)
-        if matches:
-            linkedin_profile = matches[0]  # Take only the first match
-            print(f"🎯 Found profile using regex extraction: {linkedin_profile}")
-            return clean_linkedin_url(linkedin_profile)
-    except Exception as e:
-        print(f"Regex extraction failed: {e}")
+    return None
+
+def extract_linkedin_from_html(html):
+    """Extract the first LinkedIn profile URL from a raw DuckDuckGo HTML results page (bytes)."""
+    if not has_linkedin_link(html):
+        return None
+    
+    html = html.replace(b"&amp;", b"&")
+    
+    # Result links are wrapped in a DuckDuckGo redirect: //duckduckgo.com/l/?uddg=<encoded target>
+    for href in _DDG_REDIRECT_RE.findall(html):
+        target = parse_qs(urlsplit(href.decode()).query).get("uddg", [""])[0]
+        if 'linkedin.com/in/' in target:
+            log.debug("🎯 Found profile in result link: %s", target)
+            return clean_linkedin_url(target)
+    
+    # Fall back to any plain LinkedIn URL in the page body
+    matches = _LI_RE.findall(html)
+    if matches:
+        linkedin_profile = matches[0].decode()
+        log.debug("🎯 Found profile using regex extraction: %s", linkedin_profile)
+        return clean_linkedin_url(linkedin_profile)
     
     return None
 
-async def scrape_profile_for_speaker(page, speaker, output_csv_path, scraped_profiles):
+async def block_unneeded_requests(route):
+    """Aborts images, fonts, stylesheets, media and tracker requests so pages load only what we parse."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _TRACKER_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def new_http_session():
     """
-    Scrapes only the first LinkedIn profile link from DuckDuckGo for a given speaker.
-    Tries multiple search strategies if initial search fails.
-    Writes results immediately to prevent data loss.
+    One long-lived connection pool per process: keep-alive plus cached DNS means
+    DuckDuckGo's TLS handshake and lookup are paid once, not per query.
     """
-    # Check if name is present
-    if not speaker["name"]:
-        print(f"⚠️ Skipping entry with missing name")
-        return
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=8,
+        keepalive_timeout=75,
+        ttl_dns_cache=3600,
+        use_dns_cache=True,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=15))
+
+def new_limiter():
+    """
+    Token bucket holding one process's share of DDG_REQUESTS_PER_SECOND.
+    The budget is split between the worker processes and the main process, so together they stay within it.
+    """
+    shares = WORKER_PROCESSES + 1
+    burst = max(1, DDG_REQUESTS_PER_SECOND // shares)
+    return AsyncLimiter(burst, burst * shares / DDG_REQUESTS_PER_SECOND)
+
+def is_throttled(exc):
+    """True when DuckDuckGo refused a request because we are going too fast."""
+    return isinstance(exc, aiohttp.ClientResponseError) and exc.status in THROTTLE_STATUSES
 
-    # Define multiple search strategies with confidence scores (highest confidence first)
-    search_strategies = []
+@retry(
+    retry=retry_if_exception(is_throttled),
+    wait=wait_exponential(multiplier=1, max=16),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+async def search_duckduckgo_html(session, limiter, query):
+    """
+    Runs a query against DuckDuckGo's HTML endpoint over plain HTTP.
+    Returns (profile, html); raises if the request fails or DuckDuckGo refuses to serve results.
+    Throttled requests are retried with exponential backoff before giving up.
+    """
+    encoded_query = quote_plus(query)
+    search_url = f"{DDG_HTML_URL}?q={encoded_query}"
     
-    # Strategy 1: Name + Title + Company (Confidence: 4)
-    if speaker["title"] and speaker["company"]:
-        search_strategies.append({
-            "query": f'site:linkedin.com/in "{speaker["name"]}" "{speaker["title"]}" "{speaker["company"]}"',
-            "description": "Name + Title + Company",
-            "confidence": 4
-        })
+    async with limiter, session.get(search_url, headers={"User-Agent": USER_AGENT}) as resp:
+        # DuckDuckGo answers 202 with a challenge page when it is throttling us
+        if resp.status != 200:
+            raise aiohttp.ClientResponseError(
+                resp.request_info, resp.history, status=resp.status, message="unexpected status from DuckDuckGo"
+            )
+        html = await resp.read()
     
-    # Strategy 2: Name + Company (Confidence: 3)
-    if speaker["company"]:
-        search_strategies.append({
-            "query": f'site:linkedin.com/in "{speaker["name"]}" "{speaker["company"]}"',
-            "description": "Name + Company",
-            "confidence": 3
-        })
+    return extract_linkedin_from_html(html), html
+
+async def search_duckduckgo_browser(page, limiter, query):
+    """
+    Runs a query through the full DuckDuckGo site in the browser.
+    Only used as a last resort when the HTML endpoint is unavailable. Returns (profile, html bytes, rendered);
+    rendered is False when no results container appeared, so a miss there is not a real answer.
+    """
+    # Navigate to DuckDuckGo search with URL encoding
+    encoded_query = quote_plus(query)
+    search_url = f"https://duckduckgo.com/?q={encoded_query}&ia=web"
     
-    # Strategy 3: Name + Title (Confidence: 2)
-    if speaker["title"]:
-        search_strategies.append({
-            "query": f'site:linkedin.com/in "{speaker["name"]}" "{speaker["title"]}"',
-            "description": "Name + Title",
-            "confidence": 2
-        })
+    async with limiter:
+        await page.goto(search_url, timeout=10000)  # 10 second timeout
     
-    # Strategy 4: Name only (Confidence: 1)
-    search_strategies.append({
-        "query": f'site:linkedin.com/in "{speaker["name"]}"',
-        "description": "Name only",
-        "confidence": 1
-    })
+    # Wait for whichever results container shows up first - fail fast
+    try:
+        await page.wait_for_selector("article[data-testid='result'], article, .result", timeout=2000)
+    except PlaywrightTimeoutError:
+        log.debug("⚠️ No results found for this strategy (timeout after 2s)")
+        return None, (await page.content()).encode(), False
+    
+    # Extract LinkedIn profile from a single snapshot of the current page
+    html = (await page.content()).encode()
+    return extract_linkedin_from_page(html), html, True
 
-    linkedin_profile = None
-    strategy_confidence = 0  # Initialize confidence score
+async def new_pooled_page(context):
+    """Opens a page for the fallback pool in the shared persistent context."""
+    page = await context.new_page()
+    
+    # Enable debug logging
+    page.on("console", lambda msg: log.debug("BROWSER LOG: %s", msg.text))
+    return page
+
+async def replace_page(page):
+    """
+    Swaps a page for a new one in the same context, dropping its history and in-page state.
+    Keeps the old page if a new one cannot be opened, and never raises.
+    """
+    try:
+        fresh_page = await new_pooled_page(page.context)
+    except Exception as e:
+        log.warning("⚠️ Could not replace browser page: %s", e)
+        return page
+    try:
+        await page.close()
+    except Exception as e:
+        log.warning("⚠️ Could not close worn browser page: %s", e)
+    return fresh_page
+
+def return_page(page, page_pool):
+    """Hands a page back to the pool, or to the rotation in progress if there is one."""
+    held = _BROWSER_STATE["held"]
+    if held is None:
+        page_pool.put_nowait(page)
+        return
+    held.append(page)
+    if len(held) >= BROWSER_POOL_SIZE:
+        _BROWSER_STATE["all_held"].set()
+
+async def rotate_context(page, page_pool):
+    """
+    Gives the shared persistent context a fresh identity: collects every pooled page (waiting for
+    busy ones to come back, ahead of other callers queued on the pool), then clears cookies,
+    switches the User-Agent header and reopens all pages, so no page is mid-navigation while its
+    cookies disappear. Always refills page_pool and never raises.
+    """
+    held = [page]
+    _BROWSER_STATE.update(held=held, all_held=asyncio.Event())
+    try:
+        while not page_pool.empty():
+            held.append(page_pool.get_nowait())
+        if len(held) < BROWSER_POOL_SIZE:
+            await _BROWSER_STATE["all_held"].wait()
+        
+        context = page.context
+        await context.clear_cookies()
+        # The persistent context's user agent is fixed at launch; the header is what DuckDuckGo sees
+        await context.set_extra_http_headers({"User-Agent": random.choice(USER_AGENTS)})
+        for i, old_page in enumerate(held):
+            held[i] = await replace_page(old_page)
+        log.debug("🔄 Rotated browser cookies, user agent and pages")
+    except Exception as e:
+        log.warning("⚠️ Could not rotate browser context: %s", e)
+    finally:
+        _BROWSER_STATE.update(held=None, all_held=None)
+        for held_page in held:
+            page_pool.put_nowait(held_page)
+
+async def search_duckduckgo(session, limiter, page_pool, query, use_http=True):
+    """
+    Resolves a single query to a LinkedIn profile, answering repeats from the query cache
+    and letting concurrent duplicates wait for the lookup already in flight.
+    Uses the HTML endpoint and falls back to a pooled browser page; use_http=False goes
+    straight to the browser. Returns (profile, html); html is None when the answer came
+    from the cache or another caller's lookup. Without a page pool (worker processes)
+    a failed HTML request raises BrowserFallbackNeeded instead.
+    """
+    if query in _QUERY_CACHE:
+        log.debug("📦 Using cached result for query: %s", query)
+        return _QUERY_CACHE[query], None
+    
+    pending = _IN_FLIGHT.get(query)
+    if pending is not None:
+        log.debug("⏳ Waiting for in-flight lookup of query: %s", query)
+        try:
+            found_profile, _ = await asyncio.shield(pending)
+        except BrowserFallbackNeeded as e:
+            # Each speaker attaches its own progress to the exception, so don't share the first one's
+            raise BrowserFallbackNeeded(query) from e
+        return found_profile, None
+    
+    task = asyncio.ensure_future(lookup_query(session, limiter, page_pool, query, use_http))
+    _IN_FLIGHT[query] = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        if task.done():
+            _IN_FLIGHT.pop(query, None)
+        else:
+            # We were cancelled; drop the entry once the shared lookup finishes
+            task.add_done_callback(lambda _: _IN_FLIGHT.pop(query, None))
+
+async def lookup_query(session, limiter, page_pool, query, use_http):
+    """Does the actual lookup behind search_duckduckgo and caches answers worth keeping."""
+    if use_http:
+        try:
+            found_profile, html = await search_duckduckgo_html(session, limiter, query)
+            _QUERY_CACHE[query] = found_profile
+            return found_profile, html
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.warning("⚠️ HTML endpoint failed (%s), falling back to browser", e)
+            if page_pool is None:
+                raise BrowserFallbackNeeded(query) from e
+    
+    # Borrow an idle page from the pool and always hand it back, rotating the context when it is worn
+    page = await page_pool.get()
+    try:
+        found_profile, html, rendered = await search_duckduckgo_browser(page, limiter, query)
+    finally:
+        _BROWSER_STATE["searches"] += 1
+        if _BROWSER_STATE["searches"] >= CONTEXT_ROTATE_EVERY and _BROWSER_STATE["held"] is None:
+            # Only one caller rotates at a time; the others hand their pages to it as they finish
+            _BROWSER_STATE["searches"] = 0
+            await rotate_context(page, page_pool)
+        else:
+            return_page(page, page_pool)
     
-    # Try each search strategy until we find a result
-    for i, strategy in enumerate(search_strategies):
-        print(f"\n🔍 Strategy {i+1}/{len(search_strategies)} - {strategy['description']}")
+    # A page that never rendered results may just have been slow; don't remember it as a miss
+    if rendered:
+        _QUERY_CACHE[query] = found_profile
+    return found_profile, html
+
+async def csv_writer(output_csv_path, out_q):
+    """
+    Owns the output CSV for the whole run: writes the header, then every row put on out_q.
+    Flushes every CSV_FLUSH_EVERY rows and stops when it receives None.
+    """
+    with open(output_csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDNAMES)
+        writer.writeheader()
+        
+        written = 0
+        while True:
+            row = await out_q.get()
+            if row is None:
+                break
+            writer.writerow(row)
+            written += 1
+            if written % CSV_FLUSH_EVERY == 0:
+                f.flush()
+
+def speaker_queries(speaker):
+    """Yields (description, confidence, query) for each strategy that applies to the speaker."""
+    for description, confidence, build_query in _STRATEGIES:
+        query = build_query(speaker["name"], speaker["title"], speaker["company"])
+        if not query:
+            continue
         
         # Truncate query if it's too long (DuckDuckGo has query length limits)
         max_query_length = 200  # Reduced from 400 to avoid truncation
-        query = strategy['query']
         if len(query) > max_query_length:
             # Smart truncation - try to keep the most important parts
-            if 'company' in strategy['description'].lower():
+            if 'company' in description.lower():
                 # Keep name and company, truncate title if present
-                base_query = f'site:linkedin.com/in "{speaker["name"]}" "{speaker["company"]}"'
+                base_query = f'{_LI_SITE} "{speaker["name"]}" "{speaker["company"]}"'
                 if len(base_query) <= max_query_length:
                     query = base_query
                 else:
                     query = query[:max_query_length-3] + "..."
             else:
                 query = query[:max_query_length-3] + "..."
-            print(f"⚠️ Query truncated to: {query}")
+            log.debug("⚠️ Query truncated to: %s", query)
         
-        print(f"Final query: {query}")
+        yield description, confidence, query
+
+async def find_profile_for_speaker(session, limiter, page_pool, speaker, browser_query=None):
+    """
+    Finds only the first LinkedIn profile link from DuckDuckGo for a given speaker.
+    Tries multiple search strategies if initial search fails; browser_query, if given,
+    skips the HTML endpoint for that one query. Returns (profile, confidence, last_html,
+    resolved) where resolved maps the queries searched (not served from the cache) to their results.
+    """
+    linkedin_profile = None
+    strategy_confidence = 0  # Initialize confidence score
+    last_html = None  # Most recent results page, kept for debugging misses
+    resolved = {}
+    
+    # Check if name is present
+    if not speaker["name"]:
+        log.warning("⚠️ Skipping entry with missing name")
+        return linkedin_profile, strategy_confidence, last_html, resolved
+    
+    # Try each search strategy that applies to this speaker until we find a result
+    strategies = list(speaker_queries(speaker))
+    for i, (description, confidence, query) in enumerate(strategies):
+        log.debug("🔍 %s: strategy %d/%d - %s", speaker['name'], i+1, len(strategies), description)
+        log.debug("Final query: %s", query)
         
         try:
-            # Navigate to DuckDuckGo search with URL encoding
-            import urllib.parse
-            encoded_query = urllib.parse.quote_plus(query)
-            search_url = f"https://duckduckgo.com/?q={encoded_query}&ia=web"
-            
-            await page.goto(search_url, timeout=10000)  # 10 second timeout
-            await add_delay(0.5)  # Shorter delay for faster processing
-            
-            # Wait for results with much shorter timeout - fail fast
-            results_found = False
-            try:
-                await page.wait_for_selector("article[data-testid='result']", timeout=2000)
-                results_found = True
-            except:
-                try:
-                    await page.wait_for_selector("article", timeout=2000)
-                    results_found = True
-                except:
-                    try:
-                        await page.wait_for_selector(".result", timeout=2000)
-                        results_found = True
-                    except:
-                        print(f"⚠️ No results found for this strategy (timeout after 2s)")
-                        continue
-            
-            if not results_found:
-                print(f"⚠️ Results container not found, trying next strategy")
-                continue
-                
-            # Extract LinkedIn profile from current page
-            found_profile = await extract_linkedin_from_page(page)
+            found_profile, html = await search_duckduckgo(
+                session, limiter, page_pool, query, use_http=query != browser_query
+            )
+            if html is not None:
+                last_html = html
+                if query in _QUERY_CACHE:  # Only answers worth caching are reported back
+                    resolved[query] = found_profile
             
             if found_profile:
                 linkedin_profile = found_profile
-                strategy_confidence = strategy['confidence']  # Store the confidence score
-                print(f"✅ Found profile using {strategy['description']} (Confidence: {strategy_confidence}): {linkedin_profile}")
+                strategy_confidence = confidence  # Store the confidence score
+                log.debug("✅ Found profile using %s (Confidence: %d): %s", description, strategy_confidence, linkedin_profile)
                 break
             else:
-                print(f"❌ No LinkedIn profile found with {strategy['description']}")
+                log.debug("❌ No LinkedIn profile found with %s", description)
                 
+        except BrowserFallbackNeeded as e:
+            e.resolved = resolved
+            raise
         except Exception as e:
-            print(f"❌ Error with strategy {i+1}: {e}")
+            log.warning("❌ Error with strategy %d for %s: %s", i+1, speaker['name'], e)
             continue
+    
+    return linkedin_profile, strategy_confidence, last_html, resolved
 
+async def process_one_speaker(speaker, known):
+    """
+    Pool task run in a worker process: searches one speaker over HTTP only.
+    known holds the main process's cached answers for this speaker's queries, which
+    may be newer than the snapshot the worker started with.
+    Returns (find_profile_for_speaker's result, browser_query). browser_query is the query
+    that needs the browser fallback (None if none did); the result then holds only the
+    queries resolved before it.
+    """
+    _QUERY_CACHE.update(known)
+    if not _WORKER_STATE:
+        _WORKER_STATE["loop"] = asyncio.get_running_loop()
+        _WORKER_STATE["session"] = new_http_session()
+        _WORKER_STATE["limiter"] = new_limiter()
+    
+    try:
+        profile, confidence, html, resolved = await find_profile_for_speaker(
+            _WORKER_STATE["session"], _WORKER_STATE["limiter"], None, speaker
+        )
+    except BrowserFallbackNeeded as e:
+        return (None, 0, None, e.resolved), e.query
+    
+    # Results pages only cross the process boundary when they are going to be dumped
+    return (profile, confidence, html if DEBUG else None, resolved), None
+
+def close_worker_session():
+    """Worker exit hook: closes the HTTP session on the worker's (finished, still open) event loop."""
+    session = _WORKER_STATE.pop("session", None)
+    loop = _WORKER_STATE.pop("loop", None)
+    if session is None or loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(session.close())
+    except Exception as e:
+        log.warning("⚠️ Could not close worker HTTP session: %s", e)
+
+def init_worker(query_cache, log_level):
+    """Pool initializer: seeds a worker process with the main process's query cache and logging."""
+    _QUERY_CACHE.update(query_cache)
+    listener = setup_logging(log_level)
+    
+    # Worker processes skip atexit handlers, but run multiprocessing finalizers on exit,
+    # highest priority first: close the session, then drain the log queue
+    Finalize(None, close_worker_session, exitpriority=20)
+    Finalize(None, listener.stop, exitpriority=10)
+
+@contextlib.asynccontextmanager
+async def open_worker_pool(query_cache):
+    """
+    Starts the worker process pool and shuts it down gracefully on success, so workers
+    exit normally and run their finalizers. Pool's own async with terminates (SIGTERMs) them,
+    which skips the finalizers; that is only done here when the run fails.
+    """
+    pool = Pool(
+        processes=WORKER_PROCESSES,
+        childconcurrency=CHILD_CONCURRENCY,
+        initializer=init_worker,
+        initargs=(query_cache, LOG_LEVEL)
+    )
+    try:
+        yield pool
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        await pool.join()
+
+async def record_result(speaker, linkedin_profile, strategy_confidence, last_html, out_q, scraped_profiles, io_pool):
+    """
+    Hands a found profile to the CSV writer queue unless it was already saved for another speaker.
+    Runs in the main process only, so deduplication sees every speaker. Returns the row (None if nothing was saved).
+    """
     # Process the found profile
     if linkedin_profile:
         linkedin_profile = clean_linkedin_url(linkedin_profile)
         
         # Check if this profile has already been scraped
         if linkedin_profile not in scraped_profiles:
-            # Immediately write to CSV to prevent data loss
-            with open(output_csv_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=["query_name", "query_title", "query_company", "profile_link", "confidence_score"])
-                writer.writerow({
-                    "query_name": speaker["name"],
-                    "query_title": speaker["title"],
-                    "query_company": speaker["company"],
-                    "profile_link": linkedin_profile,
-                    "confidence_score": strategy_confidence
-                })
-            
+            row = {
+                "query_name": speaker["name"],
+                "query_title": speaker["title"],
+                "query_company": speaker["company"],
+                "profile_link": linkedin_profile,
+                "confidence_score": strategy_confidence
+            }
             scraped_profiles.add(linkedin_profile)
-            print(f"✅ Found profile and saved for {speaker['name']}: {linkedin_profile} (Confidence: {strategy_confidence})")
+            await out_q.put(row)
+            
+            log.info("✅ Found profile and saved for %s: %s (Confidence: %d)", speaker['name'], linkedin_profile, strategy_confidence)
+            return row
         else:
-            print(f"⚠️ Profile already scraped for {speaker['name']}: {linkedin_profile}")
+            log.info("⚠️ Profile already scraped for %s: %s", speaker['name'], linkedin_profile)
     else:
-        print(f"ℹ️ No LinkedIn profile found for {speaker['name']}")
+        log.info("ℹ️ No LinkedIn profile found for %s", speaker['name'])
         
-        # Debug: Save HTML if no profile found
-        try:
-            html = await page.content()
-            safe_name = re.sub(r'[^\w\s-]', '', speaker['name']).strip().replace(' ', '_')
-            with open(f"debug_{safe_name}.html", "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"💾 Saved debug HTML to debug_{safe_name}.html")
-        except Exception as e:
-            print(f"Could not save debug HTML: {e}")
+        # Debug: Save the last results page in the background if no profile found
+        if DEBUG and last_html is not None:
+            safe_name = _SAFE_NAME_RE.sub('', speaker['name']).strip().replace(' ', '_')
+            asyncio.get_running_loop().run_in_executor(io_pool, write_debug_html, safe_name, last_html)
+    
+    return None
 
-async def scrape_duckduckgo_for_speakers():
-    speakers = []
+def iter_speakers(input_csv_path):
+    """
+    Streams speakers with a non-empty name from the input CSV, one row at a time.
+    Reading and filtering happen in a single pass, so the file is never held in memory.
+    """
+    with open(input_csv_path, "r", encoding="utf-8") as csvfile:
+        for row in csv.DictReader(csvfile):
+            # Use exact column names from your CSV file
+            name = row.get("Name", "").strip()
+            if not name:
+                continue
+            yield {
+                "name": name,
+                "title": row.get("Job Title", "").strip(),
+                "company": row.get("Company", "").strip()
+            }
 
+async def scrape_duckduckgo_for_speakers():
     # Check if input file exists
     if not os.path.exists(INPUT_CSV_FILE):
-        print(f"❌ Input file '{INPUT_CSV_FILE}' not found!")
+        log.error("❌ Input file '%s' not found!", INPUT_CSV_FILE)
         return
 
-    # Read the speakers CSV file with exact column names
+    # Check the headers up front, before the previous output is truncated or anything is started
     with open(INPUT_CSV_FILE, "r", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        
-        if not reader.fieldnames:
-            print("❌ CSV file appears to be empty or improperly formatted!")
-            return
-
-        print(f"📄 CSV Headers Detected: {reader.fieldnames}")
-        
-        for row in reader:
-            # Use exact column names from your CSV file
-            speakers.append({
-                "name": row.get("Name", "").strip(),
-                "title": row.get("Job Title", "").strip(),
-                "company": row.get("Company", "").strip()
-            })
+        fieldnames = csv.DictReader(csvfile).fieldnames
+    if not fieldnames:
+        log.error("❌ CSV file appears to be empty or improperly formatted!")
+        return
+    log.info("📄 CSV Headers Detected: %s", fieldnames)
 
-    print(f"✅ Loaded {len(speakers)} speakers from {INPUT_CSV_FILE}.")
-    
-    # Filter out speakers with empty names
-    speakers = [s for s in speakers if s["name"]]
-    print(f"✅ Filtered to {len(speakers)} speakers with valid names.")
-    
     # Ensure output directory exists
     output_dir = os.path.dirname(OUTPUT_CSV_FILE)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    # Create or truncate the output file and write the header
-    with open(OUTPUT_CSV_FILE, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["query_name", "query_title", "query_company", "profile_link", "confidence_score"])
-        writer.writeheader()
+    load_query_cache(QUERY_CACHE_FILE)
+    
+    # A single writer task owns the output file, so concurrent speakers never interleave writes
+    out_q = asyncio.Queue()
+    writer_task = asyncio.create_task(csv_writer(OUTPUT_CSV_FILE, out_q))
+    
+    # Debug dumps are written here so disk I/O never blocks the event loop
+    io_pool = ThreadPoolExecutor(max_workers=2)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,  # Set to True for production
-            args=['--disable-blink-features=AutomationControlled']  # Hide automation
-        )
-        
-        context = await browser.new_context(
+    # HTTP searches and parsing are sharded across worker processes; the browser fallback stays here
+    async with open_worker_pool(dict(_QUERY_CACHE)) as pool, new_http_session() as session, async_playwright() as p:
+        # A persistent profile keeps cookies and site storage across runs. Chromium's HTTP cache
+        # is bypassed anyway because request routing is enabled, and DNS is not kept in the profile.
+        # Only one run at a time can use BROWSER_PROFILE_DIR.
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=BROWSER_PROFILE_DIR,
+            headless=True,
+            args=BROWSER_ARGS,
             viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36"
+            user_agent=random.choice(USER_AGENTS)
         )
+        await context.route("**/*", block_unneeded_requests)
         
-        page = await context.new_page()
-        
-        # Enable debug logging
-        page.on("console", lambda msg: print(f"BROWSER LOG: {msg.text}"))
+        # Several pages in the one context so fallback searches can navigate in parallel
+        page_pool = asyncio.Queue()
+        for _ in range(BROWSER_POOL_SIZE):
+            page_pool.put_nowait(await new_pooled_page(context))
+        _BROWSER_STATE.update(searches=0, held=None, all_held=None)
 
         scraped_profiles = set()  # Track all scraped profile links
+        limiter = new_limiter()  # Shared by every DuckDuckGo request this process makes, HTTP or browser
+        speakers = enumerate(iter_speakers(INPUT_CSV_FILE))
+        processed = 0
         
-        # Iterate over each speaker and search for their LinkedIn profiles
-        for i, speaker in enumerate(speakers):
-            print(f"\n🚀 Processing speaker {i+1}/{len(speakers)}: {speaker['name']}")
-            try:
-                await scrape_profile_for_speaker(page, speaker, OUTPUT_CSV_FILE, scraped_profiles)
-            except Exception as e:
-                print(f"❌ Error processing {speaker['name']}: {e}")
-                # Continue with next speaker even if there's an error with the current one
-            
-            # Add a small delay between searches to avoid rate limiting
-            if i < len(speakers) - 1:
-                await add_delay(2)  # Reduced delay for faster processing
+        async def worker():
+            # Workers pull straight from the CSV stream; next() never awaits, so sharing it is safe
+            nonlocal processed
+            for i, speaker in speakers:
+                log.info("🚀 Processing speaker %d: %s", i+1, speaker['name'])
+                try:
+                    # The main process's cache is authoritative; hand the worker what it already knows
+                    known = {
+                        query: _QUERY_CACHE[query]
+                        for _, _, query in speaker_queries(speaker) if query in _QUERY_CACHE
+                    }
+                    result, browser_query = await pool.apply(process_one_speaker, (speaker, known))
+                    _QUERY_CACHE.update(result[3])  # Worker processes have their own copy of the cache
+                    if browser_query is not None:
+                        # Queries the worker answered are now cache hits; the failed one goes straight to a page
+                        log.info("🌐 Retrying %s here with the browser fallback", speaker['name'])
+                        result = await find_profile_for_speaker(
+                            session, limiter, page_pool, speaker, browser_query
+                        )
+                        _QUERY_CACHE.update(result[3])
+                    
+                    profile, confidence, html, _ = result
+                    await record_result(speaker, profile, confidence, html, out_q, scraped_profiles, io_pool)
+                except Exception as e:
+                    # One failing speaker does not stop the others
+                    log.error("❌ Error processing %s: %s", speaker['name'], e)
+                processed += 1
+        
+        # Search for speakers concurrently, at most MAX_CONCURRENT_SPEAKERS at a time
+        await asyncio.gather(*[worker() for _ in range(MAX_CONCURRENT_SPEAKERS)])
+        log.info("✅ Processed %d speakers with valid names from %s.", processed, INPUT_CSV_FILE)
+        
+        # Tell the writer we are done and wait for the last rows to hit the disk
+        await out_q.put(None)
+        await writer_task
+        save_query_cache(QUERY_CACHE_FILE)
+        # Let pending debug dumps finish without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(None, io_pool.shutdown)
 
-        print(f"\n✅ Scraping complete. Data saved to {OUTPUT_CSV_FILE}.")
-        await browser.close()
+        log.info("✅ Scraping complete. Data saved to %s.", OUTPUT_CSV_FILE)
+        await context.close()
 
 if __name__ == "__main__":
-    asyncio.run(scrape_duckduckgo_for_speakers())
\ No newline at end of file
+    listener = setup_logging()
+    try:
+        asyncio.run(scrape_duckduckgo_for_speakers())
+    finally:
+        listener.stop()  # Drains any queued records
\ No newline at end of file